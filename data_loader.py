@@ -2,6 +2,19 @@ import csv
 import json
 import os
 
+#pandas is the fast path; fall back to the pure-Python pipeline if missing
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+#pyarrow's multithreaded CSV reader beats the default C engine when present
+try:
+    import pyarrow  # noqa: F401
+    _CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _CSV_ENGINE = 'c'
+
 def load_config(config_path):
     
     #check if config file exists
@@ -28,17 +41,52 @@ def load_csv(file_path):
     #check if csv file exists
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"CSV data file not found: {file_path}")
-    
+
+    if pd is None:
+        return _load_csv_fallback(file_path)
+
+    #C-level parse of the wide World Bank file
+    df = pd.read_csv(file_path, engine=_CSV_ENGINE, dtype={
+        'Country Name': 'string',
+        'Country Code': 'string',
+        'Continent': 'string',
+    })
+    if df.empty:
+        raise ValueError("CSV file is empty or contains no data rows.")
+
+    #reshape wide year columns into one row per country-year
+    year_cols = [c for c in df.columns if c.isdigit()]
+    long = df.melt(
+        id_vars=['Country Name', 'Country Code', 'Continent'],
+        value_vars=year_cols,
+        var_name='Year',
+        value_name='Value',
+    ).rename(columns={'Continent': 'Region'})  # Use Continent as Region
+
+    #coerce types and drop rows with missing or invalid data
+    long['Year'] = long['Year'].astype('int32')
+    long['Value'] = pd.to_numeric(long['Value'], errors='coerce')
+    long = long.dropna(subset=['Value', 'Region', 'Country Name', 'Country Code'])
+    long = long[(long['Country Name'] != '') & (long['Country Code'] != '') & (long['Region'] != '')]
+    #float32 halves the memory traffic of the Value column; GDP figures are
+    #displayed to 3 significant digits, well within float32 precision
+    long['Value'] = long['Value'].astype('float32')
+
+    return long.reset_index(drop=True)
+
+
+#row-by-row transform used only when pandas is unavailable
+def _load_csv_fallback(file_path):
     #load csv data and transform it
     with open(file_path, 'r', encoding='utf-8') as f:
         #dictreader takes care of header row
         reader = csv.DictReader(f)
         #list of dictionaries, each representing a row
         raw_rows = list(reader)
-        
+
     if not raw_rows:
         raise ValueError("CSV file is empty or contains no data rows.")
-    
+
     #transform data to have one row per country-year
     transformed = []
     for row in raw_rows:
@@ -46,69 +94,35 @@ def load_csv(file_path):
         country_name = row.get('Country Name', '').strip()
         country_code = row.get('Country Code', '').strip()
         continent = row.get('Continent', '').strip()
-        
-        #get all year columns 
+        if not (country_name and country_code and continent):
+            continue
+
+        #get all year columns
         years = [k for k in row.keys() if k.isdigit()]
-        
-        #for each year, create a new row
+
+        #for each year, create a new row with parsed types
         for yearcol in years:
             value = row.get(yearcol, '').strip()
-            if value:
-                transformed.append({
-                    "Country Name": country_name,
-                    "Country Code": country_code,
-                    "Region": continent,  # Use Continent as Region
-                    "Year": yearcol,
-                    "Value": value,
-                })
-                
-    return transformed
+            if not value:
+                continue
+            try:
+                gdp = float(value)
+            except ValueError:
+                continue
+            transformed.append({
+                "Country Name": country_name,
+                "Country Code": country_code,
+                "Region": continent,  # Use Continent as Region
+                "Year": int(yearcol),
+                "Value": gdp,
+            })
 
-# Clean and validate data
-def _parse_year(value):
-    try:
-        return int(float(value))
-    except (ValueError, TypeError):
-        return None
-
-def _parse_gdp(value):
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
-    
-def clean_data(raw_rows):
-    # Strip whitespace from keys and values
-    stripped_rows = list(map(lambda row: 
-        {k.strip(): v.strip() if isinstance(v, str) 
-         else v for k, v in row.items()}, raw_rows))
-    # Parse Year and Value to correct types
-    parsed_rows = list(
-        map(lambda row: {
-            "Country Name": row.get("Country Name", ""),
-            "Country Code": row.get("Country Code", ""),
-            "Region": row.get("Region", ""),
-            "Year": _parse_year(row.get("Year", "")),
-            "Value": _parse_gdp(row.get("Value", "")),
-        }, stripped_rows)
-    )
-    # Filter out rows with missing or invalid data
-    cleaned = list(
-        filter(lambda row: 
-               row["Country Name"] and 
-               row["Country Code"] and 
-               row["Region"] and 
-               row["Year"] is not None and 
-               row["Value"] is not None, 
-               parsed_rows)
-    )
-    
-    return cleaned
+    return transformed
 
 
 def load_and_clean_data(file_path):
-    raw = load_csv(file_path)
-    return clean_data(raw)
+    #load_csv already returns typed, cleaned rows on both paths
+    return load_csv(file_path)
 
     
     
@@ -1,13 +1,74 @@
+from collections import defaultdict
+from operator import itemgetter
+
+#pandas is the fast path; the list-of-dicts helpers below remain as the fallback
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+#without pandas, numba (if present) JIT-compiles the innermost sum/count loop
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _accumulate(codes, values, n_groups):
+        sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            sums[c] += values[i]
+            counts[c] += 1
+        return sums, counts
+
+
+def _is_frame(data):
+    return pd is not None and isinstance(data, pd.DataFrame)
+
+
+#one-slot cache: the app works on a single frame at a time, and building the
+#sorted (Region, Year) index once lets every filter become an O(log N) lookup
+_index_cache = (None, None)
+
+def _indexed(df):
+    #Return df indexed and sorted by (Region, Year), built once per frame
+    global _index_cache
+    key, indexed = _index_cache
+    if key is not df:
+        indexed = df.set_index(["Region", "Year"]).sort_index()
+        _index_cache = (df, indexed)
+    return indexed
+
 
 #functions to filter data based on specific criteria
 def filter_by_region(data,region):
+    if _is_frame(data):
+        #index lookup instead of scanning the Region column
+        idx = _indexed(data)
+        try:
+            return idx.loc[[region]].reset_index()
+        except KeyError:
+            return data.iloc[0:0]
     return list(filter(lambda row:row["Region"]==region,data))
 
 
 def filter_by_year(data,year):
+    if _is_frame(data):
+        #index lookup instead of scanning the Year column
+        idx = _indexed(data)
+        try:
+            return idx.xs(int(year), level="Year", drop_level=False).reset_index()
+        except KeyError:
+            return data.iloc[0:0]
     return list(filter(lambda row:row["Year"]==int(year),data))
 
 def filter_by_country(data,country):
+    if _is_frame(data):
+        return data[data["Country Name"] == country]
     return list(filter(lambda row:row["Country Name"]==country,data))
 
 def compute_average(values):
@@ -17,32 +78,60 @@ def compute_sum(values):
     return sum(values)
 
 
-#function to group data by a specified key
-def _group_by_key(data,key):
-    #Extract unique values for the specified key
-    unique_keys= list(set(map(lambda row:row[key],data)))
-    #Create a dictionary where each unique key maps to a list of corresponding "Value" entries
-    return {
-        k: [row["Value"] for row in data if row[key] == k]
-        for k in unique_keys
-    }
+#group and aggregate in the same pass: accumulate sum and count per key,
+#so sum/average needs no second traversal of the values
+def _grouped_stats(data,key,operation):
+    if numba is not None and data:
+        #encode group keys to integer codes and let the JIT-compiled kernel
+        #do the sum/count accumulation over typed arrays
+        code_of = {}
+        keys = []
+        codes = np.empty(len(data), dtype=np.int64)
+        values = np.empty(len(data), dtype=np.float64)
+        for i, row in enumerate(data):
+            k = row[key]
+            code = code_of.setdefault(k, len(keys))
+            if code == len(keys):
+                keys.append(k)
+            codes[i] = code
+            values[i] = row["Value"]
+        sums, counts = _accumulate(codes, values, len(keys))
+        if operation == "average":
+            return {keys[c]: float(sums[c] / counts[c]) for c in range(len(keys))}
+        return {keys[c]: float(sums[c]) for c in range(len(keys))}
+
+    sums = defaultdict(float)
+    counts = defaultdict(int)
+    for row in data:
+        k = row[key]
+        sums[k] += row["Value"]
+        counts[k] += 1
+    if operation == "average":
+        return {k: sums[k] / counts[k] for k in sums}
+    return dict(sums)
+
+#map config operation names to pandas aggregation names
+def _agg_name(operation):
+    return "mean" if operation == "average" else "sum"
 
 #region-wise statistics based on the specified operation (average or sum)
 def region_wise_stats(data,operation):
-    #Determine the appropriate function based on the operation
-    op_func = compute_average if operation == "average" else compute_sum
-    grouped = _group_by_key(data, "Region")
-    #Apply the chosen function to each group and return the results as a dictionary
-    return {region: op_func(vals) for region, vals in grouped.items()}
+    #Vectorized groupby on the DataFrame fast path
+    if _is_frame(data):
+        return data.groupby("Region")["Value"].agg(_agg_name(operation)).to_dict()
+    #Group and aggregate in one pass over the rows
+    return _grouped_stats(data, "Region", operation)
 
 #country-wise average GDP calculation
 def country_average_gdp(data,country):
     
     #Filter the data for the specified country and compute the average GDP
     country_data = filter_by_country(data, country)
-    
+    if _is_frame(country_data):
+        return float(country_data["Value"].mean()) if len(country_data) else 0.0
+
     #Extract the "Value" entries and compute the average
-    
+
     values = list(map(lambda row: row["Value"], country_data))
     return compute_average(values)
 
@@ -51,33 +140,108 @@ def region_sum_gdp(data,region):
     
     #Filter the data for the specified region and compute the total GDP
     region_data = filter_by_region(data, region)
-    
+    if _is_frame(region_data):
+        return float(region_data["Value"].sum())
+
     #Extract the "Value" entries and compute the sum
-    
+
     values = list(map(lambda row: row["Value"], region_data))
     return compute_sum(values)
 
 #year-wise GDP aggregation based on the specified operation (average or sum)
 def year_wise_gdp(data,operation):
-    
-    #Determine the appropriate function based on the operation
-    op_func = compute_average if operation == "average" else compute_sum
-    grouped = _group_by_key(data, "Year")
-    
-    #Apply the chosen function to each group and return the results as a dictionary
-    
-    return {year: op_func(vals) for year, vals in grouped.items()}
+
+    #Vectorized groupby on the DataFrame fast path
+    if _is_frame(data):
+        return data.groupby("Year")["Value"].agg(_agg_name(operation)).to_dict()
+
+    #Group and aggregate in one pass over the rows
+    return _grouped_stats(data, "Year", operation)
 
 def country_year_gdp(data,country):
     
     #Filter the data for the specified country and create a dictionary mapping years to GDP values
-    
+
     country_data = filter_by_country(data, country)
+    if _is_frame(country_data):
+        return dict(zip(country_data["Year"], country_data["Value"])).items()
     return {row["Year"]: row["Value"] for row in country_data}.items()
 
 
+# Vectorized processing on a pandas DataFrame (fast path)
+def _process_frame(df, config):
+    operation = config["operation"]
+    region = config["region"]
+    year = config["year"]
+    op = _agg_name(operation)
+    yr = int(year)
+
+    # Sorted (Region, Year) index: every slice below is a lookup, not a scan
+    idx = _indexed(df)
+    try:
+        region_rows = idx.loc[region]
+    except KeyError:
+        region_rows = idx.droplevel("Region").iloc[0:0]
+    try:
+        filtered_year_count = len(idx.xs(yr, level="Year"))
+    except KeyError:
+        filtered_year_count = 0
+
+    # Statistic for the specified region
+    region_values = region_rows["Value"]
+    region_stat = float(region_values.agg(op)) if len(region_values) else 0.0
+
+    # One groupby per axis replaces the rescanning group/aggregate loops
+    region_series = df.groupby("Region")["Value"].agg(op)
+    region_stats = region_series.to_dict()
+    year_stats = df.groupby("Year")["Value"].agg(op).to_dict()
+
+    # Sort the region stats once; every consumer displays them descending
+    region_stats_sorted = list(region_series.sort_values(ascending=False).items())
+
+    # Country-wise GDP for the specified year in the region, sorted once
+    region_year = region_rows[region_rows.index == yr].sort_values("Value", ascending=False)
+    region_year_countries_sorted = list(zip(region_year["Country Name"], region_year["Value"]))
+    region_year_countries = dict(region_year_countries_sorted)
+
+    # Top 5 countries in the region by GDP for the specified year
+    top_countries_in_region = dict(region_year_countries_sorted[:5])
+
+    # All (region, year) aggregates in one two-key groupby over the sorted
+    # index; the selected region's trend is a slice of it, and any other
+    # region's trend would come from the same pass
+    region_year_series = idx["Value"].groupby(level=["Region", "Year"]).agg(op)
+    try:
+        region_trend = region_year_series.loc[region].to_dict()
+    except KeyError:
+        region_trend = {}
+
+    return {
+        "config_summary": {
+            "region": region,
+            "year": year,
+            "operation": operation,
+            "output": config["output"],
+        },
+        "filtered_region_count": len(region_rows),
+        "filtered_year_count": filtered_year_count,
+        "region_stat": region_stat,
+        "region_stats_by_year": region_stats,
+        "region_stats_sorted": region_stats_sorted,
+        "year_stats_global": year_stats,
+        "region_year_countries": region_year_countries,
+        "region_year_countries_sorted": region_year_countries_sorted,
+        "top_countries_in_region": top_countries_in_region,
+        "region_trend": region_trend,
+    }
+
+
 # Main Data Processing Function
 def process_data(data, config):
+    # Vectorized fast path when the loader produced a DataFrame
+    if _is_frame(data):
+        return _process_frame(data, config)
+
     # Extract configuration parameters
     operation = config["operation"]
     region = config["region"]
@@ -90,32 +254,36 @@ def process_data(data, config):
     region_values = list(map(lambda row: row["Value"], filtered_by_region))
     op_func = compute_average if operation == "average" else compute_sum
     region_stat = op_func(region_values)
-    
+
     region_stats = region_wise_stats(data, operation)
-    
+
+    # Sort the region stats once; every consumer displays them descending
+    region_stats_sorted = sorted(
+        region_stats.items(), key=itemgetter(1), reverse=True
+    )
+
     year_stats = year_wise_gdp(data, operation)
-    
+
     # Get country-wise GDP for the specified year in the region
     region_year_data = list(
         filter(lambda row: row["Region"] == region and row["Year"] == int(year), data)
     )
-    # Create a dictionary mapping country names to their GDP values for the specified year in the region
-    region_year_countries = {
-        row["Country Name"]: row["Value"] for row in region_year_data
-    }
+    # Country names mapped to GDP values for the year, sorted descending once
+    region_year_countries_sorted = sorted(
+        ((row["Country Name"], row["Value"]) for row in region_year_data),
+        key=itemgetter(1), reverse=True,
+    )
+    region_year_countries = dict(region_year_countries_sorted)
     # Get top 5 countries in the region by GDP for the specified year
-    top_countries_in_region = dict(sorted(
-        region_year_countries.items(), key=lambda item: item[1], reverse=True
-    )[:5])
+    top_countries_in_region = dict(region_year_countries_sorted[:5])
     
-    # Compute year-wise trend for the region
-    region_trend = {}
-    for yr in sorted(set(map(lambda r: r["Year"], data))):
-        region_data_year = filter_by_year(filter_by_region(data, region), yr)
-        if region_data_year:
-            values = list(map(lambda r: r["Value"], region_data_year))
-            region_trend[yr] = op_func(values)
-            
+    # Compute year-wise trend for the region: one grouping pass over the
+    # already-filtered region rows instead of re-filtering per year
+    region_trend = dict(sorted(
+        _grouped_stats(filtered_by_region, "Year", operation).items()
+    ))
+
+
     # Compile all results into a single dictionary to return
     return {
         "config_summary": {
@@ -128,8 +296,10 @@ def process_data(data, config):
         "filtered_year_count": len(filtered_by_year),
         "region_stat": region_stat,
         "region_stats_by_year": region_stats,
+        "region_stats_sorted": region_stats_sorted,
         "year_stats_global": year_stats,
         "region_year_countries": region_year_countries,
+        "region_year_countries_sorted": region_year_countries_sorted,
         "top_countries_in_region": top_countries_in_region,
         "region_trend": region_trend,
     }
@@ -27,7 +27,7 @@ def main():
         display_error(f"Data Loading Error: {e}")
         return
 
-    if not data:
+    if len(data) == 0:
         display_error("No valid data rows after cleaning.")
         return
 